@@ -117,6 +117,13 @@ RTL_TCP_EXTRA_ARGS="-a 0.0.0.0"
 # Sync script environment variables
 WF_HOST=127.0.0.1
 SDR_HOST=127.0.0.2
+# Optional sync tuning (defaults shown)
+#POLL_MS=200
+# Longest poll interval while idle; raise above POLL_MS to back off when nothing changes
+#IDLE_POLL_MS=200
+# Reconnect delay in seconds: starts at RECONNECT_WAIT, doubles per failure up to RECONNECT_MAX
+#RECONNECT_WAIT=0.5
+#RECONNECT_MAX=30
 
 EOF
 chmod 644 "${ENV_FILE}"
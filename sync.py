@@ -1,16 +1,54 @@
+import asyncio
+import atexit
+import queue
+import random
+import re
 import socket
 import time
+from dataclasses import dataclass
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import signal
 import os
+import json
+import stat
+
+_ENV_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "sdrsync", "env.json")
+
+def _read_env_cache(key):
+    try:
+        with open(_ENV_CACHE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        values = cached["values"]
+        if cached["key"] != list(key) or not all(isinstance(k, str) and isinstance(v, str) for k, v in values.items()):
+            return None
+        return values
+    except Exception:
+        return None
+
+def _write_env_cache(key, values):
+    try:
+        os.makedirs(os.path.dirname(_ENV_CACHE), exist_ok=True)
+        tmp = f"{_ENV_CACHE}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": list(key), "values": values}, f)
+        os.replace(tmp, _ENV_CACHE)
+    except Exception:
+        # cache is best-effort only
+        pass
 
 def _load_env_file():
     """Load key=value pairs from an env file into os.environ if not already set.
     Search order: $SDRSYNC_ENV_FILE, ./../.env, ./.env, /etc/sdrsync/sdrsync.env
+    The parsed result is cached in ~/.cache/sdrsync/env.json, keyed on the
+    file's path, mtime and size. A cache hit still stats the env file and reads
+    the JSON cache, so it saves only the line parsing, not I/O; a miss (or the
+    first run) also creates ~/.cache/sdrsync and writes the cache file.
     """
     candidates = []
-    if os.getenv("SDRSYNC_ENV_FILE"):
-        candidates.append(os.getenv("SDRSYNC_ENV_FILE"))
+    env_file = os.environ.get("SDRSYNC_ENV_FILE")
+    if env_file:
+        candidates.append(env_file)
     # repo-local .env (common while developing)
     candidates.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".env")))
     candidates.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".env")))
@@ -18,215 +56,366 @@ def _load_env_file():
     candidates.append("/etc/sdrsync/sdrsync.env")
     for path in candidates:
         try:
-            if path and os.path.isfile(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    for raw in f:
-                        line = raw.strip()
-                        if not line or line.startswith("#"):
-                            continue
-                        if "=" not in line:
-                            continue
-                        k, v = line.split("=", 1)
-                        k = k.strip()
-                        v = v.strip().strip('"').strip("'")
-                        # don't override variables already in env
-                        if k and k not in os.environ:
-                            os.environ[k] = v
+            if not path:
+                continue
+            # one stat() serves both the regular-file check and the cache key
+            st = os.stat(path)
+            if stat.S_ISREG(st.st_mode):
+                key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+                values = _read_env_cache(key)
+                if values is None:
+                    values = {}
+                    with open(path, "r", encoding="utf-8") as f:
+                        for raw in f:
+                            line = raw.strip()
+                            if not line or line.startswith("#"):
+                                continue
+                            if "=" not in line:
+                                continue
+                            k, v = line.split("=", 1)
+                            k = k.strip()
+                            v = v.strip().strip('"').strip("'")
+                            if k and k not in values:
+                                values[k] = v
+                    _write_env_cache(key, values)
+                # don't override variables already in env
+                os.environ.update({k: v for k, v in values.items() if k not in os.environ})
                 break
         except Exception:
-            # fail-soft if env file can't be read
+            # fail-soft if env file is missing or can't be read
             continue
 
 _load_env_file()
 
 
+def _int_env(name: str, default: int) -> int:
+    """Integer setting from the environment; accepts float strings like "200.0"."""
+    v = os.environ.get(name)
+    return int(float(v)) if v else default
+
+
 # ---- CONFIG (env-driven, with defaults) ----
 WF_HOST = os.getenv("WF_HOST", "127.0.0.1")
-WF_PORT = int(float(os.getenv("WF_PORT", "4533")))
+WF_PORT = _int_env("WF_PORT", 4533)
 SDR_HOST = os.getenv("SDR_HOST", "192.168.155.245")
-SDR_PORT = int(float(os.getenv("SDR_PORT", "4532")))
-POLL_MS = int(float(os.getenv("POLL_MS", "200")))
+SDR_PORT = _int_env("SDR_PORT", 4532)
+POLL_MS = _int_env("POLL_MS", 200)
+# upper bound for the poll interval while neither side is being tuned;
+# defaults to POLL_MS (no back-off) since a longer idle interval delays the first tune
+IDLE_POLL_MS = _int_env("IDLE_POLL_MS", POLL_MS)
 TIMEOUT = float(os.getenv("TIMEOUT", "3.0"))
-RECONNECT_WAIT = float(os.getenv("RECONNECT_WAIT", "2.0"))
-CHANGE_THRESHOLD_HZ = int(float(os.getenv("CHANGE_THRESHOLD_HZ", "50")))
+# reconnect delay: RECONNECT_WAIT doubled per failed attempt, capped at RECONNECT_MAX
+RECONNECT_WAIT = float(os.getenv("RECONNECT_WAIT", "0.5"))
+RECONNECT_MAX = float(os.getenv("RECONNECT_MAX", "30.0"))
+CHANGE_THRESHOLD_HZ = _int_env("CHANGE_THRESHOLD_HZ", 50)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
 # -------------------------------------------
 
-stop = False
-
-def setup_logging():
-    logging.basicConfig(
-        level=getattr(logging, LOG_LEVEL),
-        format="%(asctime)s.%(msecs)03d [%(levelname)s] %(message)s",
-        datefmt="%H:%M:%S",
-    )
+# set by sigint_handler; every wait in main() wakes on it
+stop = asyncio.Event()
 
-# ---- socket helpers ----
+_log = logging.getLogger(__name__)
 
-def connect(host: str, port: int, name: str) -> socket.socket:
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.settimeout(TIMEOUT)
-    logging.info(f"Connecting to {name} at {host}:{port} ...")
-    s.connect((host, port))
-    logging.info(f"Connected to {name}.")
-    return s
+# StreamReader buffer cap per connection; rigctl replies are a few bytes
+_RECV_LIMIT = 4096
 
-def send_line(sock: socket.socket, line: str, peer: str):
-    if not line.endswith("\n"):
-        line = line + "\n"
-    logging.debug(f"TX -> {peer}: {line.rstrip()}")
-    sock.sendall(line.encode("ascii", errors="ignore"))
+# pre-encoded rigctl commands for the per-poll hot path
+_FREQ_QUERY = b"f\n"
+_SETF_FMT = b"F %d\n"
 
+# first (optionally signed/decimal) number in a rigctl reply
+_FREQ_RE = re.compile(rb"-?\d+(?:\.\d+)?")
 
-def recv_text(sock: socket.socket, peer: str, max_bytes: int = 1024) -> str:
-    data = sock.recv(max_bytes)
-    text = data.decode(errors="ignore")
-    logging.debug(f"RX <- {peer}: {text.rstrip()}")
-    return text
+def setup_logging():
+    # QueueHandler.prepare() still merges msg % args (and any traceback) in the
+    # calling thread; the QueueListener thread then applies the timestamp/level
+    # format below and does the stderr write, keeping that I/O off the poll loop.
+    sh = logging.StreamHandler()
+    sh.setFormatter(logging.Formatter(
+        "%(asctime)s.%(msecs)03d [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    ))
+    q = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, LOG_LEVEL))
+    root.addHandler(QueueHandler(q))
+    ql = QueueListener(q, sh)
+    ql.start()
+    atexit.register(ql.stop)
+
+# ---- peers ----
+
+@dataclass(slots=True)
+class Peer:
+    """One rigctl endpoint: its address, live connection and sync state.
+    The sync state survives reconnects; only reader/writer are reset.
+    """
+    name: str
+    host: str
+    port: int
+    reader: asyncio.StreamReader | None = None
+    writer: asyncio.StreamWriter | None = None
+    # last frequency read back and when it last moved (time.monotonic())
+    last_seen_freq: int | None = None
+    last_change_ts: float = 0.0
+    # last F command acknowledged by this peer
+    last_set_freq: int | None = None
+    last_set_ts: float = 0.0
+
+    def close(self):
+        try:
+            if self.writer: self.writer.close()
+        except Exception:
+            pass
+        self.reader = self.writer = None
 
-# ---- RigCTL helpers ----
+# ---- socket helpers ----
 
-def parse_freq_from_text(text: str) -> int | None:
-    clean = text.strip()
-    for token in clean.replace(":", " ").split():
-        tok = "".join(ch for ch in token if (ch.isdigit() or ch in ".-"))
-        if not tok:
-            continue
-        try:
-            return int(tok)
-        except ValueError:
-            try:
-                fval = float(tok)
-                ival = int(round(fval))
-                return ival
-            except ValueError:
-                continue
-    return None
+def _drop(*peers: Peer):
+    """Close any open peer connections, ignoring errors."""
+    for p in peers:
+        p.close()
+
+def _backoff(attempt: int) -> float:
+    """Exponential reconnect delay with jitter so both peers aren't hit in lockstep."""
+    # clamp the exponent: attempt keeps growing while a peer stays down, and
+    # 2 ** 1024 no longer fits in a float
+    return min(RECONNECT_MAX, RECONNECT_WAIT * 2 ** min(attempt, 16)) + random.uniform(0, 0.5)
+
+async def connect(peer: Peer):
+    _log.info("Connecting to %s at %s:%s ...", peer.name, peer.host, peer.port)
+    kwargs = {}
+    # resolve once and race IPv6/IPv4 candidates (RFC 8305 happy eyeballs);
+    # only the stock asyncio loop accepts happy_eyeballs_delay, uvloop does not
+    if isinstance(asyncio.get_running_loop(), asyncio.BaseEventLoop):
+        kwargs["happy_eyeballs_delay"] = 0.25
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(peer.host, peer.port, limit=_RECV_LIMIT, **kwargs), TIMEOUT
+    )
+    s = writer.get_extra_info("socket")
+    # small request/reply traffic: never let Nagle hold back a query
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # kernel defaults (2h idle) are useless here; declare a peer dead after ~6s
+    # of silence. The failure surfaces as an OSError (ETIMEDOUT, or EHOSTUNREACH
+    # on a LAN) from the transport, which main() handles by reconnecting. While
+    # polling faster than that, the reply TIMEOUT usually notices first.
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 3)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+    peer.reader, peer.writer = reader, writer
+    _log.info("Connected to %s.", peer.name)
+
+def send_bytes(writer: asyncio.StreamWriter, payload: bytes, peer: str):
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("TX -> %s: %s", peer, payload.decode("ascii", errors="ignore").rstrip())
+    writer.write(payload)
+
+
+async def recv_frames(reader: asyncio.StreamReader, peer: str, nframes: int) -> list[bytes]:
+    """Read nframes newline-terminated reply lines, all under a single TIMEOUT deadline."""
+    async def _read():
+        # StreamReader is the line-buffered reader: each readuntil() returns
+        # exactly one frame and only touches the socket when the buffer is empty.
+        return [await reader.readuntil(b"\n") for _ in range(nframes)]
+
+    frames = await asyncio.wait_for(_read(), TIMEOUT)
+    if _log.isEnabledFor(logging.DEBUG):
+        for data in frames:
+            _log.debug("RX <- %s: %s", peer, data.decode(errors="ignore").rstrip())
+    return frames
 
+# ---- RigCTL helpers ----
 
-def rigctl_get_freq(sock: socket.socket, name: str) -> int | None:
-    send_line(sock, "f", name)
-    reply = recv_text(sock, name)
+def parse_freq_from_text(buf: bytes) -> int | None:
+    # fast path: rigctld answers 'f' with a bare line of digits
+    stripped = buf.strip()
+    if stripped.isdigit():
+        return int(stripped)
+    m = _FREQ_RE.search(buf)
+    if m is None:
+        return None
+    tok = m.group()
+    if b"." not in tok:
+        return int(tok)
+    return int(round(float(tok)))
+
+
+async def rigctl_exchange(peer: Peer, payload: bytes, nframes: int) -> list[bytes]:
+    """Write pre-encoded command bytes and read nframes reply lines.
+    payload may pipeline several newline-terminated commands, each producing
+    a single reply line, so a batch costs one write and one round-trip.
+    """
+    send_bytes(peer.writer, payload, peer.name)
+    # StreamReader pulls everything the peer already sent in one recv(), so
+    # the replies to a batch are usually split out of a single read.
+    return await recv_frames(peer.reader, peer.name, nframes)
+
+
+async def poll_once(peer: Peer) -> int | None:
+    # No drain() here: the query is tiny and goes straight to the socket, so
+    # gather() gets both queries on the wire before either coroutine blocks
+    # in readuntil(). The loop's selector (epoll) then wakes on whichever
+    # reply arrives first; StreamReader buffers fragments per connection.
+    reply, = await rigctl_exchange(peer, _FREQ_QUERY, 1)
     freq = parse_freq_from_text(reply)
     if freq is None:
-        logging.warning(f"{name}: could not parse frequency from '{reply.strip()}'")
+        _log.warning("%s: could not parse frequency from '%s'", peer.name, reply.decode(errors="ignore").strip())
     return freq
 
 
-def rigctl_set_freq(sock: socket.socket, name: str, freq: int) -> bool:
-    send_line(sock, f"F {freq}", name)
-    reply = recv_text(sock, name)
-    ok = ("RPRT 0" in reply) or reply.strip().isdigit()
+async def rigctl_set_freq(peer: Peer, freq: int) -> bool:
+    reply, = await rigctl_exchange(peer, _SETF_FMT % freq, 1)
+    ok = (b"RPRT 0" in reply) or reply.strip().isdigit()
     if not ok:
-        logging.warning(f"{name}: set freq not acknowledged: '{reply.strip()}'")
+        _log.warning("%s: set freq not acknowledged: '%s'", peer.name, reply.decode(errors="ignore").strip())
     return ok
 
 # ---- change tracking ----
 
 class Tracker:
-    def __init__(self, threshold_hz: int):
+    """Change detection and resend suppression over the state kept on each Peer.
+    All timestamps are time.monotonic() readings supplied by the caller.
+    """
+    def __init__(self, threshold_hz: int, settle_sec: float):
         self.th = threshold_hz
-        self.last = {"wf": None, "sdr": None}
-        self.last_change_time = {"wf": 0.0, "sdr": 0.0}
-
-    def update(self, side: str, new_val: int):
-        old = self.last[side]
-        if old is None or abs(new_val - old) >= self.th:
-            self.last_change_time[side] = time.time()
-            logging.debug(f"{side} changed: {old} -> {new_val} (Δ={None if old is None else abs(new_val-old)} Hz)")
-        self.last[side] = new_val
-
-    def last_changed_side(self) -> str | None:
-        wf_t = self.last_change_time["wf"]
-        sdr_t = self.last_change_time["sdr"]
-        if wf_t == 0.0 and sdr_t == 0.0:
+        self.settle = settle_sec
+
+    def update(self, peer: Peer, new_val: int, now: float) -> bool:
+        """Record a reading for peer; return True if it moved by at least the threshold."""
+        old = peer.last_seen_freq
+        changed = old is None or abs(new_val - old) >= self.th
+        if changed:
+            peer.last_change_ts = now
+            _log.debug("%s changed: %s -> %s (Δ=%s Hz)", peer.name, old, new_val, None if old is None else abs(new_val - old))
+        peer.last_seen_freq = new_val
+        return changed
+
+    def recently_sent(self, peer: Peer, freq: int, now: float) -> bool:
+        """True if freq was already set on peer within the settle window."""
+        if peer.last_set_freq is None:
+            return False
+        return now - peer.last_set_ts < self.settle and abs(freq - peer.last_set_freq) < self.th
+
+    def mark_sent(self, peer: Peer, freq: int, now: float):
+        peer.last_set_freq = freq
+        peer.last_set_ts = now
+
+    def last_changed_side(self, wf: Peer, sdr: Peer) -> Peer | None:
+        if wf.last_change_ts == 0.0 and sdr.last_change_ts == 0.0:
             return None
-        return "wf" if wf_t >= sdr_t else "sdr"
+        return wf if wf.last_change_ts >= sdr.last_change_ts else sdr
 
 # ---- main loop ----
 
-def sigint_handler(signum, frame):
-    global stop
-    stop = True
-    logging.info("Ctrl-C received, exiting...")
+def sigint_handler():
+    stop.set()
+    _log.info("Ctrl-C received, exiting...")
 
 
-def main():
-    setup_logging()
-    signal.signal(signal.SIGINT, sigint_handler)
-    logging.info(f"wfview @ {WF_HOST}:{WF_PORT} | rigctl @ {SDR_HOST}:{SDR_PORT}; poll={POLL_MS}ms, thres={CHANGE_THRESHOLD_HZ}Hz")
+async def _sleep(delay: float):
+    """Sleep for delay seconds, returning early once stop is set."""
+    try:
+        await asyncio.wait_for(stop.wait(), delay)
+    except asyncio.TimeoutError:
+        pass
 
-    poll_sec = max(0.02, POLL_MS / 1000.0)
-    tr = Tracker(CHANGE_THRESHOLD_HZ)
 
-    wf = None
-    sdr = None
+async def main():
+    setup_logging()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGINT, sigint_handler)
+    _log.info("wfview @ %s:%s | rigctl @ %s:%s; poll=%sms (idle %sms), thres=%sHz", WF_HOST, WF_PORT, SDR_HOST, SDR_PORT, POLL_MS, IDLE_POLL_MS, CHANGE_THRESHOLD_HZ)
+    _log.info("Event loop: %s", type(asyncio.get_running_loop()).__module__.partition(".")[0])
 
-    while not stop:
+    poll_sec = max(0.02, POLL_MS / 1000.0)
+    idle_sec = max(poll_sec, IDLE_POLL_MS / 1000.0)
+    # Neither wfview nor SDR++ push frequency changes over rigctl, so fall
+    # back to edge-driven polling: back off while idle, snap to poll_sec on change.
+    interval = poll_sec
+    # a target gets two poll cycles to report a set frequency back before we resend
+    tr = Tracker(CHANGE_THRESHOLD_HZ, settle_sec=2 * poll_sec)
+
+    wf = Peer("wfview", WF_HOST, WF_PORT)
+    sdr = Peer("rigctl", SDR_HOST, SDR_PORT)
+    attempt = 0
+
+    while not stop.is_set():
         # ensure connections
         try:
-            if wf is None:
-                wf = connect(WF_HOST, WF_PORT, "wfview")
-            if sdr is None:
-                sdr = connect(SDR_HOST, SDR_PORT, "rigctl")
-        except Exception as e:
-            logging.error(f"Connect error: {e}. Retrying in {RECONNECT_WAIT:.1f}s ...")
-            for so in (wf, sdr):
-                try:
-                    if so: so.close()
-                except Exception:
-                    pass
-            wf = sdr = None
-            time.sleep(RECONNECT_WAIT)
+            for p in (wf, sdr):
+                if p.writer is None:
+                    await connect(p)
+        except (OSError, asyncio.TimeoutError) as e:
+            delay = _backoff(attempt)
+            _log.error("Connect error: %s. Retrying in %.1fs ...", e, delay)
+            _drop(wf, sdr)
+            await _sleep(delay)
+            attempt += 1
             continue
 
         try:
-            wf_freq = rigctl_get_freq(wf, "wfview")
-            sdr_freq = rigctl_get_freq(sdr, "rigctl")
-
+            # query both peers concurrently: one poll costs max(RTT), not the sum
+            wf_freq, sdr_freq = await asyncio.gather(
+                poll_once(wf),
+                poll_once(sdr),
+                return_exceptions=True,
+            )
+            for res in (wf_freq, sdr_freq):
+                if isinstance(res, BaseException):
+                    raise res
+            attempt = 0
+            # one clock read per cycle; monotonic so NTP steps can't reorder changes
+            now = time.monotonic()
+
+            changed = False
             if wf_freq is not None:
-                tr.update("wf", wf_freq)
+                changed |= tr.update(wf, wf_freq, now)
             if sdr_freq is not None:
-                tr.update("sdr", sdr_freq)
+                changed |= tr.update(sdr, sdr_freq, now)
 
             if wf_freq is not None and sdr_freq is not None:
                 delta = abs(wf_freq - sdr_freq)
                 if delta >= CHANGE_THRESHOLD_HZ:
-                    source = tr.last_changed_side()
-                    if source == "wf":
-                        logging.info(f"Sync rigctl -> {wf_freq} Hz (Δ={delta})")
-                        rigctl_set_freq(sdr, "rigctl", wf_freq)
-                    elif source == "sdr":
-                        logging.info(f"Sync wfview -> {sdr_freq} Hz (Δ={delta})")
-                        rigctl_set_freq(wf, "wfview", sdr_freq)
+                    changed = True
+                    source = tr.last_changed_side(wf, sdr)
+                    if source is sdr:
+                        target, freq = wf, sdr_freq
                     else:
-                        # tie-breaker: prefer wfview as source
-                        logging.info(f"(tie) Sync rigctl -> {wf_freq} Hz (Δ={delta})")
-                        rigctl_set_freq(sdr, "rigctl", wf_freq)
+                        # wfview changed last, or tie-breaker: prefer wfview as source
+                        target, freq = sdr, wf_freq
+                    if tr.recently_sent(target, freq, now):
+                        _log.debug("%s: %s Hz already sent, waiting for it to settle.", target.name, freq)
+                    else:
+                        _log.info("%sSync %s -> %s Hz (Δ=%s)", "(tie) " if source is None else "", target.name, freq, delta)
+                        if await rigctl_set_freq(target, freq):
+                            tr.mark_sent(target, freq, now)
                 else:
-                    logging.debug(f"In sync (Δ={delta} Hz < {CHANGE_THRESHOLD_HZ}).")
-
-            time.sleep(poll_sec)
-
-        except (socket.timeout, ConnectionResetError, BrokenPipeError) as e:
-            logging.error(f"I/O error: {e}. Reconnecting in {RECONNECT_WAIT:.1f}s ...")
-            for so in (wf, sdr):
-                try:
-                    if so: so.close()
-                except Exception:
-                    pass
-            wf = sdr = None
-            time.sleep(RECONNECT_WAIT)
+                    _log.debug("In sync (Δ=%s Hz < %s).", delta, CHANGE_THRESHOLD_HZ)
+
+            interval = poll_sec if changed else min(interval * 2, idle_sec)
+            await _sleep(interval)
+
+        # OSError covers ConnectionError and transport errors such as EHOSTUNREACH;
+        # a StreamReader re-raises a stored error forever, so always reconnect
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            delay = _backoff(attempt)
+            _log.error("I/O error: %r. Reconnecting in %.1fs ...", e, delay)
+            _drop(wf, sdr)
+            await _sleep(delay)
+            attempt += 1
         except Exception as e:
-            logging.exception(f"Unexpected error: {e}")
-            time.sleep(poll_sec)
+            _log.exception("Unexpected error: %s", e)
+            await _sleep(poll_sec)
 
-    for so in (wf, sdr):
-        try:
-            if so: so.close()
-        except Exception:
-            pass
-    logging.info("Exited cleanly.")
+    _drop(wf, sdr)
+    _log.info("Exited cleanly.")
 
 if __name__ == "__main__":
-    main()
+    # optional: libuv-backed event loop, if installed (pip install uvloop)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(main())